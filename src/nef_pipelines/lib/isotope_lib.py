@@ -25,9 +25,18 @@ class Isotope(UppercaseStrEnum):
     P31 = auto()
 
     def __str__(self):
-        element = self.name.rstrip(string.digits)
-        isotope_number = self.name[len(element) :]
-        return f"{isotope_number}{element}"
+        return self._display_name
+
+
+def _isotope_display_name(isotope: Isotope) -> str:
+    element = isotope.name.rstrip(string.digits)
+    isotope_number = isotope.name[len(element) :]
+    return f"{isotope_number}{element}"
+
+
+# the display names [e.g. 1H, 15N] are fixed so calculate them once on import
+for _isotope in Isotope:
+    _isotope._display_name = _isotope_display_name(_isotope)
 
 
 # fmt: off
@@ -223,11 +223,9 @@ def create_entry_from_stdin() -> Optional[Entry]:
     try:
         entry = None
         if not sys.stdin.isatty() or running_in_pycharm():
-            stdin_lines = sys.stdin.read()
-            if stdin_lines is None:
+            lines = sys.stdin.read()
+            if lines is None:
                 lines = ""
-            else:
-                lines = "".join(stdin_lines)
 
             if len(lines.strip()) != 0:
                 entry = Entry.from_string(lines)
@@ -270,12 +268,9 @@ def read_entry_from_stdin_or_exit() -> Entry:
         exit_error("you appear to be reading from an empty stdin")
 
     try:
-        stdin_lines = sys.stdin.read()
-        if stdin_lines is None:
-            lines = [
-                "",
-            ]
-        lines = "".join(stdin_lines)
+        lines = sys.stdin.read()
+        if lines is None:
+            lines = ""
     except IOError as e:
         exit_error(
             f"failed to read stdin because: {e}",
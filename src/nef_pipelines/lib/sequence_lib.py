@@ -245,6 +245,27 @@ TRANSLATIONS_3_1 = {
 }
 
 
+def _add_lower_case_1let_translations(
+    translations: Optional[Dict[str, str]]
+) -> Optional[Dict[str, str]]:
+    if translations is None:
+        return None
+    return {
+        **{
+            name_1let.lower(): name_3let
+            for name_1let, name_3let in translations.items()
+        },
+        **translations,
+    }
+
+
+# 1 letter translations that accept either case, so translation doesn't need to call upper per residue
+_TRANSLATIONS_1_3_ANY_CASE = {
+    molecule_type: _add_lower_case_1let_translations(translations)
+    for molecule_type, translations in TRANSLATIONS_1_3.items()
+}
+
+
 class BadResidue(Exception):
     """
     Bad residue found in a sequence
@@ -299,23 +320,30 @@ def translate_1_to_3(
 
     """
 
-    translations = TRANSLATIONS_1_3[molecule_type]
+    translations = _TRANSLATIONS_1_3_ANY_CASE[molecule_type]
 
-    result = []
-    for i, residue_name_1let in enumerate(sequence):
-        if residue_name_1let == " ":
-            continue
-        original_residue_name_1let = residue_name_1let
-        residue_name_1let = residue_name_1let.upper()
-        if translations is None:
-            result.append(residue_name_1let)
-        elif residue_name_1let in translations:
-            result.append(translations[residue_name_1let])
-        else:
-            if unknown:
-                result.append(unknown)
-            else:
-                raise BadResidue(original_residue_name_1let, i, sequence)
+    if translations is None:
+        return [
+            residue_name_1let.upper()
+            for residue_name_1let in sequence
+            if residue_name_1let != " "
+        ]
+
+    # translate everything in one comprehension with a bound dict.get, unknown residues give None
+    # unless an unknown name is provided...
+    translate = translations.get
+    unknown = unknown if unknown else None
+    result = [
+        translate(residue_name_1let, unknown)
+        for residue_name_1let in sequence
+        if residue_name_1let != " "
+    ]
+
+    # ...and if there were any unknown residues go back to find the first one for the error
+    if unknown is None and None in result:
+        for i, residue_name_1let in enumerate(sequence):
+            if residue_name_1let != " " and residue_name_1let not in translations:
+                raise BadResidue(residue_name_1let, i, sequence)
 
     return result
 
@@ -937,13 +965,16 @@ def make_chunked_sequence_1let(
     :return: a list of formatted strings one per line
     """
 
-    rows = chunks(sequence_1_let, line_length)
+    sequence_1_let = list(sequence_1_let)
 
+    # slice rows and sub chunks directly from the list rather than building chunk lists
     row_strings = []
-    for row in rows:
-        row_chunks = list(chunks(row, sub_chunk))
-        row_string = ["".join(chunk) for chunk in row_chunks]
-        row_strings.append(" ".join(row_string))
+    for row_start in range(0, len(sequence_1_let), line_length):
+        row = sequence_1_let[row_start : row_start + line_length]
+        row_chunks = [
+            "".join(row[i : i + sub_chunk]) for i in range(0, len(row), sub_chunk)
+        ]
+        row_strings.append(" ".join(row_chunks))
 
     return row_strings
 
@@ -1,5 +1,7 @@
+from array import array
 from dataclasses import dataclass, field
 from enum import auto
+from math import isnan, nan
 from typing import Dict, List, Optional, Union
 
 from strenum import LowercaseStrEnum, StrEnum
@@ -21,6 +23,9 @@ class SequenceResidue: ...  # noqa: E701
 class Residue: ...  # noqa: E701
 
 
+class PeakTable: ...  # noqa: E701
+
+
 # something like this migh be nice
 # but we would need updates...
 # class ResidueAssignmentState(StrEnum):
@@ -180,8 +185,127 @@ class PeakList:
     peaks: List[Dict[Union[int, str], Peak]]
 
 
+def _none_to_nan(value: Optional[float]) -> float:
+    return nan if value is None else value
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    return None if isnan(value) else value
+
+
+@dataclass
+class PeakTable:
+    """
+    the peaks of a peak list stored column by column [a structure of arrays] rather than as a
+    dict per peak, numeric columns are held in contiguous arrays with missing values stored as nan
+    the per axis columns are indexed by axis and then by peak
+    """
+
+    num_axis: int
+
+    serials: array = field(default_factory=lambda: array("q"))
+    heights: array = field(default_factory=lambda: array("d"))
+    height_uncertainties: array = field(default_factory=lambda: array("d"))
+    volumes: array = field(default_factory=lambda: array("d"))
+    volume_uncertainties: array = field(default_factory=lambda: array("d"))
+    widths: array = field(default_factory=lambda: array("d"))
+    deleted: array = field(default_factory=lambda: array("b"))
+    comments: List[str] = field(default_factory=list)
+
+    ppms: List[array] = None
+    merits: List[List[str]] = None
+    atom_labels: List[List[AtomLabel]] = None
+
+    def __post_init__(self):
+        if self.ppms is None:
+            self.ppms = [array("d") for _ in range(self.num_axis)]
+        if self.merits is None:
+            self.merits = [[] for _ in range(self.num_axis)]
+        if self.atom_labels is None:
+            self.atom_labels = [[] for _ in range(self.num_axis)]
+
+    def __len__(self):
+        return len(self.serials)
+
+    def append_peak(self, peak: Dict[Union[int, str], Union[PeakAxis, PeakValues]]):
+        """
+        add a peak in the per peak dict form used by PeakList
+        :param peak: a dict of PeakValues [key "values"] and a PeakAxis for each axis [keys 0..num_axis-1]
+        """
+        values = peak["values"]
+
+        self.serials.append(values.serial)
+        self.heights.append(_none_to_nan(values.height))
+        self.height_uncertainties.append(_none_to_nan(values.height_uncertainty))
+        self.volumes.append(_none_to_nan(values.volume))
+        self.volume_uncertainties.append(_none_to_nan(values.volume_uncertainty))
+        self.widths.append(_none_to_nan(values.width))
+        self.deleted.append(bool(values.deleted))
+        self.comments.append(values.comment)
+
+        for axis_index in range(self.num_axis):
+            axis = peak[axis_index]
+            self.ppms[axis_index].append(_none_to_nan(axis.ppm))
+            self.merits[axis_index].append(axis.merit)
+            self.atom_labels[axis_index].append(axis.atom_labels)
+
+    def to_peaks(self) -> List[Dict[Union[int, str], Union[PeakAxis, PeakValues]]]:
+        """
+        convert the table back to the per peak dicts used by PeakList
+        :return: a list of peaks as dicts of PeakValues [key "values"] and PeakAxis [keys 0..num_axis-1]
+        """
+        result = []
+        for peak_index in range(len(self)):
+            peak = {
+                "values": PeakValues(
+                    serial=self.serials[peak_index],
+                    height=_nan_to_none(self.heights[peak_index]),
+                    height_uncertainty=_nan_to_none(
+                        self.height_uncertainties[peak_index]
+                    ),
+                    volume=_nan_to_none(self.volumes[peak_index]),
+                    volume_uncertainty=_nan_to_none(
+                        self.volume_uncertainties[peak_index]
+                    ),
+                    deleted=bool(self.deleted[peak_index]),
+                    comment=self.comments[peak_index],
+                    width=_nan_to_none(self.widths[peak_index]),
+                )
+            }
+            for axis_index in range(self.num_axis):
+                peak[axis_index] = PeakAxis(
+                    atom_labels=self.atom_labels[axis_index][peak_index],
+                    ppm=_nan_to_none(self.ppms[axis_index][peak_index]),
+                    merit=self.merits[axis_index][peak_index],
+                )
+            result.append(peak)
+
+        return result
+
+    def filter_ppm(self, axis_index: int, low: float, high: float) -> List[bool]:
+        """
+        find the peaks with a position between low and high [inclusive] on an axis
+        :param axis_index: the index of the axis to check
+        :param low: the lowest ppm to accept
+        :param high: the highest ppm to accept
+        :return: a mask with one bool per peak, peaks without a position are never selected
+        """
+        return [low <= ppm <= high for ppm in self.ppms[axis_index]]
+
+    @staticmethod
+    def from_peak_list(peak_list: PeakList) -> PeakTable:
+        result = PeakTable(peak_list.peak_list_data.num_axis)
+        for peak in peak_list.peaks:
+            result.append_peak(peak)
+        return result
+
+
 @dataclass
 class LineInfo:
+    # one of these is kept for every line read so avoid a per instance __dict__
+    # [dataclass(slots=True) needs python 3.10]
+    __slots__ = ("file_name", "line_no", "line")
+
     file_name: str
     line_no: int
     line: str
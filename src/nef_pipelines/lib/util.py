@@ -690,6 +690,8 @@ def flatten(in_list: Union[List[Any], List[Union[List[Any], Any]]]) -> List[Any]
     return out
 
 
+# the version can't change while we are running so only read it once
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
     """
         get the current version of nef pipelines
@@ -18,6 +18,7 @@ from nef_pipelines.transcoders.nmrpipe.nmrpipe_lib import (
     gdb_to_3let_sequence,
     get_column_indices,
     get_gdb_columns,
+    iter_db_records,
     read_db_file_records,
     select_records,
 )
@@ -115,6 +116,27 @@ def test_read_gdb_file():
     assert result == expected
 
 
+def test_iter_db_records():
+    TEST_DATA = """\
+    VARS   INDEX X_AXIS
+    FORMAT %5d   %9.3f
+
+        1   10.000
+        2   20.000
+    """
+
+    file_h = io.StringIO(TEST_DATA)
+    records = iter_db_records(file_h)
+
+    # records are parsed one at a time as lines are read and are the same as those read into a DbFile
+    assert next(records).type == "VARS"
+    assert file_h.readline().split()[0] == "FORMAT"
+
+    file_h.seek(0)
+    records = iter_db_records(file_h)
+    assert list(records) == read_db_file_records(io.StringIO(TEST_DATA)).records
+
+
 def test_too_many_vars():
     TOO_MANY_VARS = """\
     DATA SEQUENCE MQIFVKTLTG KTITLEVEPS DTIENVKAKI QDKEGIPPDQ QRLIFAGKQL
@@ -1,5 +1,18 @@
+from io import StringIO
+from textwrap import dedent
+
+import pytest
+
+from nef_pipelines.lib.structures import AtomLabel, SequenceResidue
 from nef_pipelines.lib.test_lib import assert_lines_match
-from nef_pipelines.transcoders.nmrpipe.nmrpipe_lib import format_pipe_sequence
+from nef_pipelines.transcoders.nmrpipe.nmrpipe_lib import (
+    _assignments_to_atom_labels,
+    _is_int_fast,
+    _read_db_file_lines,
+    format_pipe_sequence,
+    read_db_file_records,
+    read_peak_file,
+)
 
 
 def test_format_pipe_sequence():
@@ -15,3 +28,70 @@ def test_format_pipe_sequence():
     result = "\n".join(lines)
 
     assert_lines_match(result, EXPECTED)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("12", True),
+        ("-12", True),
+        ("+12", True),
+        ("0", True),
+        ("-", False),
+        ("", False),
+        ("1.0", False),
+        ("HN", False),
+        ("²", False),
+    ],
+)
+def test_is_int_fast(value, expected):
+    assert _is_int_fast(value) == expected
+
+
+def test_read_db_file_lines_from_current_position():
+    TEST_DATA = "preamble\nVARS INDEX X_AXIS\nFORMAT %5d %9.3f\n\n    1 10.000\n"
+
+    file_h = StringIO(TEST_DATA)
+    file_h.readline()
+
+    assert _read_db_file_lines(file_h) == StringIO(TEST_DATA).readlines()[1:]
+
+
+def test_assignments_to_atom_labels_pads_missing_dimensions():
+    result = _assignments_to_atom_labels([["A", "1", "HN"]], 3, "A")
+
+    EXPECTED = [
+        AtomLabel(SequenceResidue("A", 1, "ALA"), "HN"),
+        AtomLabel(SequenceResidue(None, None, None), None),
+        AtomLabel(SequenceResidue(None, None, None), None),
+    ]
+
+    assert result == EXPECTED
+
+
+def test_read_peak_file_filter_noise():
+    TEST_DATA = """\
+        VARS   INDEX X_AXIS X_PPM HEIGHT ASS TYPE
+        FORMAT %5d  %9.3f  %8.3f %+e   %s  %d
+
+            1   10.000   8.000 1.0e+06 A1HN 1
+            2   20.000   7.000 1.0e+03 peak 2
+            3   30.000   6.000 1.0e+06 A2HN 1
+    """
+    gdb_file = read_db_file_records(dedent(TEST_DATA).split("\n"))
+
+    peak_list = read_peak_file(gdb_file, "A", filter_noise=True)
+
+    assert [peak["values"].serial for peak in peak_list.peaks] == [1, 3]
+
+
+def test_read_peak_file_no_peaks_optional_columns_missing():
+    TEST_DATA = """\
+        VARS   INDEX X_AXIS ASS
+        FORMAT %5d  %9.3f  %s
+    """
+    gdb_file = read_db_file_records(dedent(TEST_DATA).split("\n"))
+
+    peak_list = read_peak_file(gdb_file, "A")
+
+    assert peak_list.peaks == []
@@ -10,6 +10,7 @@ from nef_pipelines.lib.sequence_lib import (
     count_residues,
     get_chain_code_iter,
     get_chain_starts,
+    make_chunked_sequence_1let,
     offset_chain_residues,
     sequence_3let_to_sequence_residues,
     sequences_from_frames,
@@ -293,3 +294,25 @@ def test_sequence_from_frame_all():
     ]
 
     assert sequence == EXPECTED
+
+
+def test_make_chunked_sequence_1let():
+    result = make_chunked_sequence_1let(
+        list(ABC_SEQUENCE_1LET), sub_chunk=3, line_length=9
+    )
+
+    assert result == ["acd efg hik", "lmn pqr stv", "wy"]
+
+
+def test_make_chunked_sequence_1let_multi_letter():
+    result = make_chunked_sequence_1let(
+        ["A", "Xx", "C", "D"], sub_chunk=2, line_length=3
+    )
+
+    assert result == ["AXx C", "D"]
+
+
+def test_make_chunked_sequence_1let_empty_code():
+    result = make_chunked_sequence_1let(["AB", ""], sub_chunk=1, line_length=3)
+
+    assert result == ["AB "]
@@ -0,0 +1,64 @@
+from nef_pipelines.lib.structures import (
+    AtomLabel,
+    PeakAxis,
+    PeakList,
+    PeakListData,
+    PeakTable,
+    PeakValues,
+    SequenceResidue,
+)
+
+
+def _make_test_peak_list():
+    peak_list_data = PeakListData(
+        num_axis=2,
+        axis_labels=["H", "N"],
+        data_set=None,
+        sweep_widths=None,
+        spectrometer_frequencies=[600.0, 60.8],
+    )
+
+    residue = SequenceResidue("A", 1, "ALA")
+    peaks = [
+        {
+            "values": PeakValues(serial=1, height=1000.0, volume=None, comment=""),
+            0: PeakAxis(atom_labels=AtomLabel(residue, "H"), ppm=8.1, merit=1),
+            1: PeakAxis(atom_labels=AtomLabel(residue, "N"), ppm=121.2, merit=1),
+        },
+        {
+            "values": PeakValues(
+                serial=2, height=None, volume=20.0, deleted=True, comment="test"
+            ),
+            0: PeakAxis(atom_labels=AtomLabel(residue, "H"), ppm=7.9, merit=1),
+            1: PeakAxis(atom_labels=AtomLabel(residue, "N"), ppm=118.4, merit=1),
+        },
+    ]
+
+    return PeakList(peak_list_data, peaks)
+
+
+def test_peak_table_columns():
+    peak_table = PeakTable.from_peak_list(_make_test_peak_list())
+
+    assert len(peak_table) == 2
+    assert list(peak_table.serials) == [1, 2]
+    assert list(peak_table.ppms[0]) == [8.1, 7.9]
+    assert list(peak_table.ppms[1]) == [121.2, 118.4]
+    assert list(peak_table.deleted) == [False, True]
+    assert peak_table.comments == ["", "test"]
+
+
+def test_peak_table_round_trip():
+    peak_list = _make_test_peak_list()
+
+    peak_table = PeakTable.from_peak_list(peak_list)
+
+    assert peak_table.to_peaks() == peak_list.peaks
+
+
+def test_peak_table_filter_ppm():
+    peak_table = PeakTable.from_peak_list(_make_test_peak_list())
+
+    assert peak_table.filter_ppm(0, 8.0, 9.0) == [True, False]
+    assert peak_table.filter_ppm(1, 118.4, 121.2) == [True, True]
+    assert peak_table.filter_ppm(1, 130.0, 140.0) == [False, False]
@@ -2,7 +2,6 @@ from pathlib import Path
 from typing import List
 
 import typer
-from ordered_set import OrderedSet
 from typer import Argument, Option
 
 from nef_pipelines.lib.nef_lib import (
@@ -59,22 +58,25 @@ def rename(
     entry = read_entry_from_file_or_stdin_or_exit_error(input)
 
     changes = 0
-    changed_frames = OrderedSet()
+    changed_frames = {}
 
     frames_to_process = select_frames(entry, frame_selectors, selector_type)
 
     for save_frame in frames_to_process:
         for loop in save_frame.loop_iterator():
-            for tag in loop.get_tag_names():
-                tag_parts = tag.split(".")
-                if tag_parts[-1].startswith("chain_code"):
-                    tag_values = loop[tag]
-                    for i, row in enumerate(tag_values):
-                        if row == old:
-                            tag_values[i] = new
-                            changes += 1
-                            changed_frames.add(save_frame.name)
+            chain_code_tags = [
+                tag
+                for tag in loop.get_tag_names()
+                if tag.rsplit(".", 1)[-1].startswith("chain_code")
+            ]
+            for tag in chain_code_tags:
+                tag_values = loop[tag]
+                if old not in tag_values:
+                    continue
 
-                    loop[tag] = tag_values
+                changes += tag_values.count(old)
+                changed_frames[save_frame.name] = None
+
+                loop[tag] = [new if row == old else row for row in tag_values]
 
     print(entry)
@@ -229,11 +229,8 @@ def _guess_dimensions_if_not_defined_or_throw(
             guessed_dimension_isotopes = guessed_dimensions.setdefault(
                 dimension_index, set()
             )
-            if atom_type and atom_type in ATOM_TO_ISOTOPE:
-                isotope_code = ATOM_TO_ISOTOPE[atom_type]
-                guessed_dimension_isotopes.add(isotope_code)
-            else:
-                guessed_dimension_isotopes.add(UNUSED)
+            isotope_code = ATOM_TO_ISOTOPE.get(atom_type, UNUSED)
+            guessed_dimension_isotopes.add(isotope_code)
 
     for guessed_dimension_index in guessed_dimensions:
         if guessed_dimension_index not in results_by_dimension:
@@ -1,12 +1,11 @@
 from collections import Counter
 from dataclasses import dataclass
-from itertools import chain, cycle, islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
 import typer
 from fastaparser import Reader
-from ordered_set import OrderedSet
 from pynmrstar import Entry
 
 from nef_pipelines.lib.nef_lib import (
@@ -177,7 +176,11 @@ def pipe(
 
     fasta_residues = offset_chain_residues(fasta_residues, offsets)
 
-    fasta_residues = sorted(fasta_residues)
+    # attrgetter builds the keys in C rather than comparing whole residues field by field,
+    # the residues are unique by chain and sequence code so the order is unchanged
+    fasta_residues = sorted(
+        fasta_residues, key=attrgetter("chain_code", "sequence_code")
+    )
 
     fasta_frames.append(
         sequence_to_nef_frame(fasta_residues, no_chain_starts, no_chain_ends)
@@ -191,37 +194,42 @@ def pipe(
 def _get_sequence_offsets(chain_codes: List[str], starts: List[int]):
 
     offsets = [start - 1 for start in starts]
-    cycle_starts = chain(
-        offsets,
-        cycle(
-            [
-                0,
-            ]
-        ),
-    )
-    offsets = list(islice(cycle_starts, len(chain_codes)))
 
-    return {chain_code: offset for chain_code, offset in zip(chain_codes, offsets)}
+    # chains without a start aren't offset, zip drops any extra starts
+    offsets.extend([0] * (len(chain_codes) - len(offsets)))
+
+    return dict(zip(chain_codes, offsets))
 
 
 def residues_to_chain_codes(residues: List[SequenceResidue]) -> List[str]:
-    return list(OrderedSet([residue.chain_code for residue in residues]))
+    return list(dict.fromkeys(residue.chain_code for residue in residues))
 
 
 @dataclass
 class Sequence:
     entry_id: str
     comment: str
-    sequence: List[str]
+    sequence: str
     chain_code: str = None
     starts: int = 1
 
 
+def _parse_definition_line(definition_line: str) -> Tuple[str, str]:
+    # as fastaparser: the first space separates the id from the description
+    id_and_description = [*definition_line.split(maxsplit=1), "", ""]
+
+    sequence_id, description = id_and_description[:2]
+    sequence_id = sequence_id[1:] if sequence_id.startswith(">") else sequence_id
+
+    return sequence_id, description
+
+
 # could do with taking a list of offsets
 # noinspection PyUnusedLocal
 #
 def _parse_fasta(fasta_sequence, parse_header: bool = True) -> Sequence:
-    definition = fasta_sequence.formatted_definition_line()
+    sequence_id, description = _parse_definition_line(fasta_sequence.header)
+    definition = f">{sequence_id} {description}" if description else f">{sequence_id}"
     bar_count = definition.count("|")
     last_part = definition.split()[-1]
     is_bracketed = last_part.startswith("(") and last_part.endswith(")")
@@ -230,8 +238,8 @@ def _parse_fasta(fasta_sequence, parse_header: bool = True) -> Sequence:
     chain_code = None
     start = 1
 
-    if fasta_sequence.description.startswith("NEFPLS") and parse_header:
-        fields = fasta_sequence.description.split("|")
+    if description.startswith("NEFPLS") and parse_header:
+        fields = description.split("|")
         for field in fields:
 
             field = field.strip()
@@ -243,18 +251,17 @@ def _parse_fasta(fasta_sequence, parse_header: bool = True) -> Sequence:
                 if is_int(field[-1]):
                     start = int(field.split()[-1])
 
-        entry_id, comment = fasta_sequence.id, fasta_sequence.description
+        entry_id, comment = sequence_id, description
 
     elif bar_count == 3 and is_bracketed and is_last_field_number:
         fields = definition.split("|")
         entry_id = fields[0].lstrip(">")
         comment = "__".join(fields[1:])
     else:
-        sequence_id = "".join([c if c.isalnum() else "_" for c in fasta_sequence.id])
-        entry_id, comment = sequence_id, fasta_sequence.description
+        sequence_id = "".join([c if c.isalnum() else "_" for c in sequence_id])
+        entry_id, comment = sequence_id, description
 
-    letters = [letter_code.letter_code for letter_code in fasta_sequence.sequence]
-    return Sequence(entry_id, comment, letters, chain_code, start)
+    return Sequence(entry_id, comment, fasta_sequence.sequence, chain_code, start)
 
 
 @dataclass
@@ -312,8 +319,12 @@ def _read_sequences(
         try:
             with open(file_path) as handle:
                 try:
-                    reader = Reader(handle)
+                    # the quick parser yields the header and sequence as plain strings
+                    # rather than building an object for every residue
+                    reader = Reader(handle, parse_method="quick")
                     for fasta_sequence in reader:
+                        if not fasta_sequence.sequence:
+                            raise ValueError("sequence must be a non empty str")
                         sequence_records.append(
                             _parse_fasta(fasta_sequence, parse_header)
                         )
@@ -335,7 +346,8 @@ def _read_sequences(
         """
         exit_error(msg)
 
-    residues = OrderedSet()
+    # a dict keeps insertion order and removes duplicates
+    residues: Dict[SequenceResidue, None] = {}
     # read as many chain codes as there are sequences
     # https://stackoverflow.com/questions/16188270/get-a-fixed-number-of-items-from-a-generator
 
@@ -387,7 +399,7 @@ def _read_sequences(
             {sequence_record.chain_code: sequence_record.starts - 1},
         )
 
-        residues.update(chain_residues)
+        residues.update(dict.fromkeys(chain_residues))
 
     entry_names = [
         sequence_record.entry_id
@@ -395,7 +407,7 @@ def _read_sequences(
         if sequence_record.entry_id
     ]
 
-    return residues, entry_names
+    return list(residues), entry_names
 
 
 def _exit_if_there_are_replicate_chain_codes_from_files(
@@ -1,12 +1,22 @@
-import functools
-import operator
 import re
-from collections import Counter
 from dataclasses import dataclass, field
 from enum import IntEnum
 from fnmatch import fnmatch
+from functools import lru_cache
+from itertools import chain
 from textwrap import dedent
-from typing import Callable, List, Optional, TextIO, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 from tabulate import tabulate
 
@@ -29,7 +39,7 @@ from nef_pipelines.lib.structures import (
     ShiftData,
     ShiftList,
 )
-from nef_pipelines.lib.util import exit_error, is_int
+from nef_pipelines.lib.util import exit_error
 
 
 class PEAK_TYPES(IntEnum):
@@ -49,12 +59,22 @@ COMMENT = "#"
 NULLSTRING = "NULLSTRING"
 NULLVALUE = "NULLVALUE"
 
+# the last character of a FORMAT field and the type it converts to
+_FORMAT_TO_CONSTRUCTOR = {"d": int, "f": float, "s": str, "e": float}
+_CONSTRUCTOR_TO_NAME = {int: "int", float: "float", str: "str"}
+
+# splits an assignment into residue, sequence code and atom name e.g. A12HN -> A 12 HN
+_DIGIT_RE = re.compile(r"(\d+)")
+_TOKEN_RE = re.compile(r"\S+")
+
+# the names of the axes of a peak file in order
+_AXIS_LETTERS = ("X", "Y", "Z", "A")
+
 NMRPIPE_PEAK_EXPECTED_FIELDS = "INDEX X_AXIS XW XW_HZ ASS CLUSTID MEMCNT".split()
 NMRPIPE_SHIFTS_EXPECTED_FIELDS = "RESID RESNAME ATOMNAME SHIFT".split()
 
 
-@dataclass(frozen=True)
-class DbRecord:
+class DbRecord(NamedTuple):
     index: int
     type: str
     values: Tuple[Union[int, str, float]]
@@ -66,6 +86,11 @@ class DbFile:
     name: str = "unknown"
     records: List[DbRecord] = field(default_factory=list)
 
+    # the records grouped by type, built on first use by select_records
+    _records_by_type: Optional[Dict[str, List[DbRecord]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
 
 def _raise_data_before_format(line_info):
     msg = f"""\
@@ -78,139 +103,138 @@ def _raise_data_before_format(line_info):
     raise DataBeforeFormat(msg)
 
 
+# the record types allowed before the end of the header [the FORMAT line]
+_HEADER_RECORD_TYPES = {VARS, FORMAT, DATA, REMARK, COMMENT}
+
+
+def _read_db_file_lines(file_h: Union[TextIO, Iterable[str]]) -> Iterable[str]:
+    # read files in one call rather than line by line, the lines are the same as iterating the
+    # file would give; other iterables of lines [e.g. lists of strings] are used as they are
+    return file_h.readlines() if hasattr(file_h, "readlines") else file_h
+
+
 def read_db_file_records(file_h: TextIO, file_name: str = "unknown") -> DbFile:
     """
     Read from NmrPipe (NIH) tab/gdb-file
     Args:
-        file_h (TextIO): a file like object
+        file_h (TextIO): a file like object or an iterable of lines
         file_name (str): the name of the file being read (for debugging)
 
     Returns DbFile:
         a list of all the records in the fiule
     """
 
-    records: List[DbRecord] = []
+    lines = _read_db_file_lines(file_h)
+
+    return DbFile(file_name, list(iter_db_records(lines, file_name)))
+
+
+def iter_db_records(
+    file_h: Union[TextIO, Iterable[str]], file_name: str = "unknown"
+) -> Iterator[DbRecord]:
+    """
+    Read the records of an NmrPipe (NIH) tab/gdb-file one at a time, lines are read from the
+    file as the records are needed rather than all at once
+    Args:
+        file_h (TextIO): a file like object or an iterable of lines
+        file_name (str): the name of the file being read (for debugging)
+
+    Returns Iterator[DbRecord]:
+        the records in the file in the order they were read
+    """
+
     column_names = None
     column_formats = None
-    record_count = Counter()
+    # serial numbers for the header and other non value records by type
+    record_serials: Dict[str, int] = {}
+    values_serial = 0
+    seen_vars = False
     in_header = True
 
     for line_index, line in enumerate(file_h):
 
-        line_info = LineInfo(file_name, line_index + 1, line)
-        line = line.strip()
-
-        raw_fields = line.strip().split()
+        # split with no arguments already ignores leading and trailing whitespace
+        fields = line.split()
 
-        if len(line) == 0:
+        if not fields:
             continue
 
-        record_type = raw_fields[0]
-        record_count[record_type] += 1
-
-        fields = raw_fields
-
-        handled = False
+        line_info = LineInfo(file_name, line_index + 1, line)
 
-        if in_header:
-            if record_type == "VARS":
+        record_type = fields[0]
 
-                column_names = fields[1:]
-                records.append(
-                    DbRecord(
-                        record_count[record_type], record_type, column_names, line_info
-                    )
-                )
-                handled = True
+        # most lines are data so check for them first and avoid any header handling
+        if not in_header:
 
-                if record_count[record_type] != 1:
-                    _raise_multiple(record_type, line_info)
+            if record_type in (VARS, FORMAT):
+                _raise_multiple(record_type, line_info)
 
-            if record_type == "FORMAT":
-                column_formats = _formats_to_constructors(fields, line_info)
+            if column_names and column_formats:
+                values_serial += 1
 
-                _check_var_and_format_count_raise_if_bad(
-                    column_names, column_formats, line_info
+                values = _build_values_or_raise(
+                    column_formats, column_names, fields, line_info
                 )
 
-                records.append(
-                    DbRecord(
-                        record_count[record_type], record_type, fields[1:], line_info
-                    )
-                )
-                in_header = False
-                continue
+                yield DbRecord(values_serial, VALUES, values, line_info)
+            else:
+                serial = record_serials.get(record_type, 0) + 1
+                record_serials[record_type] = serial
+                yield DbRecord(serial, record_type, fields[1:], line_info)
+            continue
 
-            if record_type in ("REMARK", "#"):
-                records.append(
-                    DbRecord(record_count[record_type], record_type, line, line_info)
-                )
-                handled = True
+        if record_type not in _HEADER_RECORD_TYPES:
+            _raise_data_before_format(line_info)
 
-            if record_type == DATA:
-                records.append(
-                    DbRecord(
-                        record_count[record_type], record_type, fields[1:], line_info
-                    )
-                )
-                handled = True
+        if record_type == VARS:
+            if seen_vars:
+                _raise_multiple(record_type, line_info)
+            seen_vars = True
 
-            if not handled:
-                _raise_data_before_format(line_info)
+            column_names = fields[1:]
 
-        if not in_header:
+        elif record_type == FORMAT:
+            column_formats = _formats_to_constructors(fields, line_info)
 
-            if record_type in (VARS, FORMAT):
-                _raise_multiple(record_type, line_info)
+            _check_var_and_format_count_raise_if_bad(
+                column_names, column_formats, line_info
+            )
 
-            if column_names and column_formats:
-                record_count["__VALUES__"] += 1
+            in_header = False
 
-                del record_count[record_type]
+        serial = record_serials.get(record_type, 0) + 1
+        record_serials[record_type] = serial
 
-                values = _build_values_or_raise(
-                    column_formats, column_names, fields, line_info
-                )
+        values = line.strip() if record_type in (REMARK, COMMENT) else fields[1:]
 
-                record = DbRecord(
-                    record_count["__VALUES__"], "__VALUES__", values, line_info
-                )
-                records.append(record)
+        yield DbRecord(serial, record_type, values, line_info)
 
-                handled = True
 
-        if not handled:
-            records.append(
-                DbRecord(record_count[record_type], record_type, fields[1:], line_info)
-            )
+def _token_spans(line: str) -> List[Tuple[int, int]]:
+    # the start and end of each whitespace separated token in a line, in the same order as str.split()
+    return [match.span() for match in _TOKEN_RE.finditer(line)]
 
-    return DbFile(file_name, records)
 
+def _build_values_or_raise(column_formats, column_names, fields, line_info):
+    _check_column_count_raise_if_bad(column_formats, column_names, fields, line_info)
 
-def _find_nth(haystack, needle, n):
-    # https://stackoverflow.com/questions/1883980/find-the-nth-occurrence-of-substring-in-a-string/41626399#41626399
-    start = haystack.find(needle)
-    while start >= 0 and n > 1:
-        start = haystack.find(needle, start + len(needle))
-        n -= 1
-    return start
+    # convert the whole row in one go, the field by field walk is only needed to report a failure
+    try:
+        return [
+            constructor(raw_field)
+            for constructor, raw_field in zip(column_formats, fields)
+        ]
+    except Exception:
+        _raise_bad_field(column_formats, fields, line_info)
 
 
-def _build_values_or_raise(column_formats, column_names, fields, line_info):
-    columns_formats = _check_column_count_raise_if_bad(
-        column_formats, column_names, line_info
-    )
-    result = []
-    field_count = Counter()
-    for column_no, (raw_field, constructor) in enumerate(zip(fields, columns_formats)):
+def _raise_bad_field(column_formats, fields, line_info):
+    for column_no, (raw_field, constructor) in enumerate(zip(fields, column_formats)):
         try:
-            field_count[raw_field] += 1
-            value = constructor(raw_field)
+            constructor(raw_field)
 
         except Exception:
-            absolute_column = _find_nth(
-                line_info.line, raw_field, field_count[raw_field]
-            )
+            absolute_column, _ = _token_spans(line_info.line)[column_no]
             msg = f"""
                     Couldn't convert {raw_field} to type {_constructor_to_name(constructor)}
                     file: {line_info.file_name}
@@ -221,8 +245,6 @@ def _build_values_or_raise(column_formats, column_names, fields, line_info):
                 """
             msg = dedent(msg)
             raise BadFieldFormat(msg)
-        result.append(value)
-    return result
 
 
 def _raise_multiple(format_str, line_info):
@@ -265,15 +287,14 @@ def _check_var_and_format_count_raise_if_bad(column_names, column_formats, line_
         raise WrongColumnCount(msg)
 
 
-def _check_column_count_raise_if_bad(column_formats, column_names, line_info):
-    raw_fields = line_info.line.split()
-    num_fields = len(raw_fields)
+def _check_column_count_raise_if_bad(column_formats, column_names, fields, line_info):
+    num_fields = len(fields)
     num_columns = len(column_formats)
 
-    missing_fields = ["*"] * abs(num_fields - num_columns)
-    raw_fields = [*raw_fields, *missing_fields]
-
     if num_fields != num_columns:
+        missing_fields = ["*"] * abs(num_fields - num_columns)
+        raw_fields = [*fields, *missing_fields]
+
         column_formats = _constructor_names(column_formats)
         tab = [
             column_names,
@@ -297,41 +318,33 @@ def _check_column_count_raise_if_bad(column_formats, column_names, line_info):
         msg = dedent(msg)
         msg = msg % tabulated
         raise WrongColumnCount(msg)
-    return column_formats
 
 
 def _formats_to_constructors(formats, line_info):
-    result = []
+    # the type of a format is its last character e.g. %9.3f -> f, fields from split are already stripped
+    result = [
+        _FORMAT_TO_CONSTRUCTOR.get(field_format[-1]) for field_format in formats[1:]
+    ]
 
-    field_counter = Counter()
-    for column_index, field_format in enumerate(formats[1:]):
-        field_counter[field_format] += 1
-        field_format = field_format.strip()
-        field_format = field_format[-1]
-
-        if field_format == "d":
-            result.append(int)
-        elif field_format == "f":
-            result.append(float)
-        elif field_format == "s":
-            result.append(str)
-        elif field_format == "e":
-            result.append(float)
-        else:
-            format_column = _find_nth(
-                line_info.line, field_format, field_counter[field_format]
-            )
-            msg = f"""
-                unexpected format {field_format} at index {column_index+1}, expected formats are:
-                s, d, e, f (string, integer, scientific(float), float)
+    if None in result:
+        column_index = result.index(None)
+        field_format = formats[column_index + 1][-1]
 
-                file: {line_info.file_name}
-                line no: {line_info.line_no}
-                line: {line_info.line}
-                      {' ' * format_column + '^'}
+        # the caret marks the format character at the end of the format's token
+        _, format_end = _token_spans(line_info.line)[column_index + 1]
+        format_column = format_end - 1
+        msg = f"""
+            unexpected format {field_format} at index {column_index+1}, expected formats are:
+            s, d, e, f (string, integer, scientific(float), float)
+
+            file: {line_info.file_name}
+            line no: {line_info.line_no}
+            line: {line_info.line}
+                  {' ' * format_column + '^'}
+
+        """
+        raise BadFieldFormat(msg)
 
-            """
-            raise BadFieldFormat(msg)
     return result
 
 
@@ -351,12 +364,26 @@ def select_records(
     Returns List[DbRecord]:
         in the selected gdb/tab records
     """
-    result = [record for record in gdb.records if record.type == record_type]
+    records = _records_by_type(gdb).get(record_type, [])
     if predicate:
-        result = [record for record in result if predicate(record)]
+        result = [record for record in records if predicate(record)]
+    else:
+        result = list(records)
     return result
 
 
+def _records_by_type(gdb: DbFile) -> Dict[str, List[DbRecord]]:
+    # group the records in a single scan rather than scanning them for every selection,
+    # the records of a DbFile are not changed once it has been read
+    if gdb._records_by_type is None:
+        records_by_type = {}
+        for record in gdb.records:
+            records_by_type.setdefault(record.type, []).append(record)
+        gdb._records_by_type = records_by_type
+
+    return gdb._records_by_type
+
+
 def select_data_records(gdb: DbFile, type: str) -> List[DbRecord]:
     """
     Select data records from the db file that have the specific type
@@ -383,12 +410,14 @@ def gdb_to_3let_sequence(
     Returns List[SequenceResidue]:
         a list of sequence residues
     """
-    sequence_records = select_data_records(gdb, "SEQUENCE")
-
-    sequence = [record.values[1:] for record in sequence_records]
+    # only look at the DATA records [grouped by type on the DbFile] with no intermediate lists
+    sequence = (
+        record.values[1:]
+        for record in _records_by_type(gdb).get(DATA, [])
+        if record.values and record.values[0] == SEQUENCE
+    )
 
-    flattened_sequence = functools.reduce(operator.iconcat, sequence, [])
-    sequence_string = "".join(flattened_sequence)
+    sequence_string = "".join(chain.from_iterable(sequence))
 
     return translate_1_to_3(sequence_string, molecule_type=molecule_type)
 
@@ -433,6 +462,24 @@ def gdb_to_sequence(gdb_file: DbFile, chain_code: str) -> List[SequenceResidue]:
     return sequence_residues
 
 
+def _is_int_fast(value: str) -> bool:
+    # a faster is_int for split fields, isdecimal avoids the cost of raising and catching a ValueError
+    # from int for every non integer and only accepts characters int can convert
+    return value.isdecimal() or (
+        len(value) > 1 and value[0] in "+-" and value[1:].isdecimal()
+    )
+
+
+# pads the assignments of peaks with fewer assignments than dimensions, atom labels are frozen so it can be shared
+_EMPTY_ATOM_LABEL = AtomLabel(SequenceResidue(None, None, None), None)
+
+
+# there are only a few distinct residue codes in a peak file but one translation per assignment
+@lru_cache(maxsize=64)
+def _one_to_three(residue_code: str) -> str:
+    return translate_1_to_3(residue_code, unknown=".")[0]
+
+
 def _assignments_to_atom_labels(assignments, dimensions, chain_code):
     result = []
 
@@ -442,12 +489,12 @@ def _assignments_to_atom_labels(assignments, dimensions, chain_code):
         residue_name = None
         len_assignment = len(assignment)
         if len_assignment > 0:
-            residue_name = translate_1_to_3(assignment[0], unknown=".")[0]
+            residue_name = _one_to_three(assignment[0])
 
         sequence_code = None
         if len_assignment > 1:
             raw_sequence_code = assignment[1]
-            if is_int(raw_sequence_code):
+            if _is_int_fast(raw_sequence_code):
                 sequence_code = int(raw_sequence_code)
 
         atom_name = None
@@ -462,8 +509,7 @@ def _assignments_to_atom_labels(assignments, dimensions, chain_code):
 
     len_result = len(result)
     if len_result < dimensions:
-        for i in len_result - dimensions:
-            result.append(AtomLabel(SequenceResidue(None, None, None), None))
+        result.extend([_EMPTY_ATOM_LABEL] * (dimensions - len_result))
     return result
 
 
@@ -501,10 +547,6 @@ def get_column_indices(gdb_file):
     return {column: index for index, column in enumerate(get_gdb_columns(gdb_file))}
 
 
-def _mean(values):
-    return sum(values) / len(values)
-
-
 def _get_peak_list_dimension(gdb_file):
 
     return len(_get_axis_labels(gdb_file))
@@ -547,71 +589,88 @@ def read_peak_file(gdb_file, chain_code, filter_noise=False):
 
     axis_labels = _get_axis_labels(gdb_file)
 
-    spectrometer_frequencies = [[] for _ in range(dimensions)]
+    # running totals for the mean spectrometer frequency of each axis
+    frequency_sums = [0.0] * dimensions
+    frequency_counts = [0] * dimensions
 
     raw_peaks = []
-    for index, line in enumerate(data, start=1):
+    if data:
+        # look up the columns once rather than for every peak; HEIGHT and the PPM columns are
+        # optional, so only look them up if there are peaks that need them
+        type_index = column_indices.get("TYPE")
+        assignment_index = column_indices["ASS"]
+        height_index = column_indices["HEIGHT"]
+        volume_index = column_indices.get("VOL")
+
+        axis_indices = [
+            (
+                column_indices["%s_PPM" % dimension],
+                column_indices.get("%s_HZ" % dimension),
+            )
+            for dimension in _AXIS_LETTERS[:dimensions]
+        ]
 
-        peak = {}
-        raw_peaks.append(peak)
+        for index, line in enumerate(data, start=1):
 
-        if "TYPE" in column_indices:
-            peak_type = line.values[column_indices["TYPE"]]
-            if filter_noise and peak_type != PEAK_TYPES.PEAK:
-                continue
+            values = line.values
 
-        assignment = line.values[column_indices["ASS"]]
+            # skip noise before doing any work so it doesn't leave empty peaks in the list
+            if filter_noise and type_index is not None:
+                if values[type_index] != PEAK_TYPES.PEAK:
+                    continue
 
-        # deep uses 'peak' as an empty assignment
-        # TODO: does this need something more thoughtful?
-        if assignment != "peak":
-            assignments = assignment.split("-")
-            assignments = _propagate_assignments(assignments)
-            assignments = _assignments_to_atom_labels(
-                assignments, dimensions, chain_code
-            )
-        else:
-            assignments = [UNASSIGNED_ATOM] * dimensions
+            peak = {}
+            raw_peaks.append(peak)
 
-        height = line.values[column_indices["HEIGHT"]]
-        # TODO: sort out height errors
-        # height_error = line.values[column_indices["DHEIGHT"]]
-        # height_percentage_error = height_error / height
+            assignment = values[assignment_index]
 
-        volume = line.values[column_indices["VOL"]] if "VOL" in column_indices else None
-        # volume_error = volume * height_percentage_error
+            # deep uses 'peak' as an empty assignment
+            # TODO: does this need something more thoughtful?
+            if assignment != "peak":
+                assignments = assignment.split("-")
+                assignments = _propagate_assignments(assignments)
+                assignments = _assignments_to_atom_labels(
+                    assignments, dimensions, chain_code
+                )
+            else:
+                assignments = [UNASSIGNED_ATOM] * dimensions
 
-        peak_values = PeakValues(
-            serial=index, volume=volume, height=height, deleted=False, comment=""
-        )
-        peak["values"] = peak_values
+            height = values[height_index]
+            # TODO: sort out height errors
+            # height_error = line.values[column_indices["DHEIGHT"]]
+            # height_percentage_error = height_error / height
 
-        for i, dimension in enumerate("X Y Z A".split()[:dimensions]):
+            volume = values[volume_index] if volume_index is not None else None
+            # volume_error = volume * height_percentage_error
 
-            shift = line.values[column_indices["%s_PPM" % dimension]]
+            peak_values = PeakValues(
+                serial=index, volume=volume, height=height, deleted=False, comment=""
+            )
+            peak["values"] = peak_values
 
-            # point_error = line.values[column_indices["D%s" % dimension]]
+            for i, (shift_index, hz_index) in enumerate(axis_indices):
 
-            # point = line.values[column_indices["%s_AXIS" % dimension]]
-            # shift_error = point_error / point * shift
+                shift = values[shift_index]
 
-            pos_hz = (
-                line.values[column_indices["%s_HZ" % dimension]]
-                if "%s_HZ" % dimension in column_indices
-                else None
-            )
+                # point_error = line.values[column_indices["D%s" % dimension]]
 
-            axis = PeakAxis(atom_labels=assignments[i], ppm=shift, merit=1)
+                # point = line.values[column_indices["%s_AXIS" % dimension]]
+                # shift_error = point_error / point * shift
 
-            peak[i] = axis
+                pos_hz = values[hz_index] if hz_index is not None else None
 
-            if pos_hz:
-                sf = pos_hz / shift
+                axis = PeakAxis(atom_labels=assignments[i], ppm=shift, merit=1)
 
-                spectrometer_frequencies[i].append(sf)
+                peak[i] = axis
+
+                if pos_hz:
+                    frequency_sums[i] += pos_hz / shift
+                    frequency_counts[i] += 1
 
     spectrometer_frequencies = [
-        _mean(frequencies) for frequencies in spectrometer_frequencies if frequencies
+        frequency_sum / frequency_count
+        for frequency_sum, frequency_count in zip(frequency_sums, frequency_counts)
+        if frequency_count
     ]
     header_data = PeakListData(
         num_axis=dimensions,
@@ -655,7 +714,7 @@ def _propagate_assignments(assignments):
     current = []
     result = []
     for assignment in assignments:
-        fields = re.split(r"(\d+)", assignment)
+        fields = _DIGIT_RE.split(assignment)
         if len(fields) == 3:
             current = fields[:2]
         elif len(fields) == 1:
@@ -667,9 +726,7 @@ def _propagate_assignments(assignments):
 
 
 def _constructor_to_name(constructor):
-    constructors_to_type_name = {int: "int", float: "float", str: "str"}
-
-    return constructors_to_type_name[constructor]
+    return _CONSTRUCTOR_TO_NAME[constructor]
 
 
 def _constructor_names(constructors):
@@ -10,7 +10,7 @@ from nef_pipelines.lib.structures import (
     RdcRestraint,
     SequenceResidue,
 )
-from nef_pipelines.lib.util import chunks, exit_error, read_float_or_exit
+from nef_pipelines.lib.util import exit_error, read_float_or_exit
 from nef_pipelines.transcoders.pales import export_app
 
 app = typer.Typer()
@@ -153,13 +153,3 @@ def _print_restraints(
         table.append(row)
 
     print(tabulate.tabulate(table, tablefmt="plain"))
-
-
-def _print_pipe_sequence(sequence_1_let: List[str]):
-
-    rows = chunks(sequence_1_let, 100)
-
-    for row in rows:
-        row_chunks = list(chunks(row, 10))
-        row_strings = ["".join(chunk) for chunk in row_chunks]
-        print(f'DATA SEQUENCE {" ".join(row_strings)}')